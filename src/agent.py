@@ -1,5 +1,7 @@
+import collections
 import datetime
-from typing import List, Optional 
+import functools
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 from google.adk.agents.llm_agent import LlmAgent
 from google.adk.sessions import InMemorySessionService
 from google.adk.sessions.base_session_service import BaseSessionService
@@ -8,9 +10,70 @@ from google.adk.tools.mcp_tool import MCPTool
 from google.adk.models.lite_llm import LiteLlm
 from google.genai import types
 
-from src.evals.trajectory import Message, Trajectory, parse_events_to_trajectory
+from src import json_utils
+from src.evals.trajectory import MessageRecord, ROLE_USER, TrajectoryBuilder, TrajectoryRecord
 
 DEFAULT_APP_NAME = "jira_mcp_agent"
+TOOL_LOOP_THRESHOLD = 3
+TOOL_LOOP_TERMINATED_REASON = "tool_loop"
+
+
+@functools.lru_cache(maxsize=8)
+def _get_litellm(model_name: str) -> LiteLlm:
+    """
+    Returns a shared LiteLlm instance per model name. LiteLlm holds no per-request state,
+    so agents using the same model can share one instance and its client.
+    """
+    return LiteLlm(model=model_name)
+
+
+@functools.lru_cache(maxsize=256)
+def _user_content(prompt: str) -> types.Content:
+    """
+    Returns the user Content for a prompt, reused across runs of the same prompt.
+    The Runner only rewrites inline_data parts, so text-only Content is never mutated.
+    Built with `model_construct`, as a plain text prompt needs no validation.
+    """
+    return types.Content.model_construct(
+        role=ROLE_USER,
+        parts=[types.Part.model_construct(text=prompt)],
+    )
+
+
+def _args_key(args: Dict[str, Any]) -> int:
+    return hash(json_utils.dumps(args, default=str, sort_keys=True))
+
+
+class _ToolLoopDetector:
+    """
+    Detects an agent stuck repeating the same failing tool call, which otherwise grows
+    the context (and cost) with every retry.
+    """
+
+    def __init__(self, threshold: int = TOOL_LOOP_THRESHOLD):
+        self._call_args: Dict[Optional[str], int] = {}
+        self._recent = collections.deque(maxlen=threshold)
+
+    def observe(self, messages: List[MessageRecord]) -> bool:
+        """
+        Records the tool calls and results in the trajectory messages built from an event.
+        Reading them from the messages avoids walking the event's parts again.
+
+        Returns:
+            True once the last `threshold` tool results are identical failing calls.
+        """
+        for message in messages:
+            for tool_call in message.assistant_tool_calls or ():
+                self._call_args[tool_call.call_id] = _args_key(tool_call.args)
+
+            for tool_result in message.tool_results or ():
+                args_key = self._call_args.pop(tool_result.call_id, None)
+                self._recent.append((tool_result.name, args_key, tool_result.is_error))
+
+        if len(self._recent) < self._recent.maxlen:
+            return False
+        first = self._recent[0]
+        return first[2] and all(entry == first for entry in self._recent)
 
 
 class JiraMcpAgent:
@@ -41,8 +104,12 @@ class JiraMcpAgent:
         self.agent_name = agent_name
         self.litellm_model_name = litellm_model_name
         self.tools = tools
+        # Number of runs aborted because the agent was stuck in a failing tool call loop
+        self.tool_loop_abort_count = 0
+        # (user_id, session_id) of sessions created by `prewarm` and not yet used by a run
+        self._prewarmed_sessions: Set[Tuple[str, str]] = set()
 
-        self.model = LiteLlm(model=self.litellm_model_name)
+        self.model = _get_litellm(self.litellm_model_name)
         self.agent = LlmAgent(
             model=self.model,
             name=self.agent_name,
@@ -60,41 +127,71 @@ class JiraMcpAgent:
             session_service=self.session_service
         )
 
+    def prewarm(self, session_ids: Iterable[str], user_id: str = "user_id") -> None:
+        """
+        Creates the given sessions ahead of time, so that the session service round-trip is
+        not on the critical path of each run. The first run with each session uses it as is.
+
+        Args:
+            session_ids: The IDs of the sessions that upcoming runs will use.
+            user_id: The ID of the user the sessions belong to.
+        """
+        for session_id in session_ids:
+            self.session_service.create_session(
+                app_name=self.app_name, user_id=user_id, session_id=session_id
+            )
+            self._prewarmed_sessions.add((user_id, session_id))
+
 
     async def run(
         self, prompt: str, user_id: str = "user_id", session_id: str = "session_id"
-    ) -> Trajectory:
+    ) -> TrajectoryRecord:
         """
         Runs the agent with the given prompt and session information.
 
         Args:
             prompt: The user's input prompt.
             user_id: The ID of the user.
-            session_id: The ID of the session.
+            session_id: The ID of the session. A fresh session is created for the run, unless
+                        one was already created for it by `prewarm`.
 
         Returns:
-            A Trajectory object representing the agent's execution.
+            A TrajectoryRecord representing the agent's execution (use `to_pydantic()` for the
+            Trajectory model). If the agent gets stuck repeating the same failing tool call,
+            the run is stopped early and the partial trajectory is returned with
+            `terminated_reason="tool_loop"`.
         """
-        self.session_service.create_session(
-            app_name=self.app_name, user_id=user_id, session_id=session_id
-        )
+        prewarmed_key = (user_id, session_id)
+        if prewarmed_key in self._prewarmed_sessions:
+            self._prewarmed_sessions.discard(prewarmed_key)
+        else:
+            self.session_service.create_session(
+                app_name=self.app_name, user_id=user_id, session_id=session_id
+            )
 
         timestamp_usr_msg = datetime.datetime.now().timestamp()
-        user_msg = Message(
+        user_msg = MessageRecord(
             author="user",
-            role="user",
+            role=ROLE_USER,
             user_text_input=prompt,
             timestamp=timestamp_usr_msg,
         )
 
-        content = types.Content(role="user", parts=[types.Part(text=prompt)])
-        new_events = []
-        async for event in self.runner.run_async(
+        content = _user_content(prompt)
+        builder = TrajectoryBuilder(initial_message=user_msg)
+        loop_detector = _ToolLoopDetector()
+        events = self.runner.run_async(
             user_id=user_id, session_id=session_id, new_message=content
-        ):
-            new_events.append(event)
-
-        trajectory = parse_events_to_trajectory(new_events)
-        trajectory.messages.insert(0, user_msg)
-
-        return trajectory
\ No newline at end of file
+        )
+        try:
+            async for event in events:
+                new_messages = builder.add_event(event)
+
+                if loop_detector.observe(new_messages):
+                    self.tool_loop_abort_count += 1
+                    print(f"Aborting run for session {session_id}: repeated failing tool call detected.")
+                    return builder.finish(terminated_reason=TOOL_LOOP_TERMINATED_REASON)
+        finally:
+            await events.aclose()
+
+        return builder.finish()
\ No newline at end of file
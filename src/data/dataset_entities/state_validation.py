@@ -11,8 +11,113 @@ Key features:
 - Configurable validation with multiple API calls
 """
 
-from typing import Any, Dict, List, Optional
-from pydantic import BaseModel, Field
+from dataclasses import dataclass
+import functools
+from typing import Any, Dict, List, Optional, Tuple, Union
+from pydantic import BaseModel, ConfigDict, Field
+
+
+PathStep = Union[int, str]
+
+# A trie of compiled paths: a node maps each next step to its child node, and lists the
+# paths that end at that node
+PathTrieNode = Tuple[Dict[PathStep, "PathTrieNode"], List[str]]
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_path(path: str) -> Tuple[PathStep, ...]:
+    """
+    Compiles a dot notation path into its access steps, with array indices as ints.
+    e.g. 'issues.0.summary' -> ('issues', 0, 'summary')
+    """
+    return tuple(int(part) if part.isdigit() else part for part in path.split('.'))
+
+
+def _build_path_trie(paths: List[str]) -> PathTrieNode:
+    """
+    Builds a trie of the given dot notation paths, so shared prefixes such as 'issues.0'
+    are only walked once.
+    """
+    root: PathTrieNode = ({}, [])
+    for path in paths:
+        node = root
+        for step in _compile_path(path):
+            node = node[0].setdefault(step, ({}, []))
+        node[1].append(path)
+    return root
+
+
+def _flatten(data: Any, node: PathTrieNode, flat: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Walks the data once along the path trie, collecting the value found at each path.
+
+    This supports:
+    - Dictionary key access: 'user.name' accesses data['user']['name']
+    - Array index access: 'issues.0' accesses data['issues'][0]
+    - Mixed access: 'issues.0.status.name' accesses data['issues'][0]['status']['name']
+
+    Args:
+        data: The dictionary or list to search in
+        node: The trie node of the paths to collect from `data`
+        flat: The dictionary to add the found values to, keyed by their dot notation path
+
+    Returns:
+        `flat`, mapping every path that was found to its value. Paths not found are omitted.
+    """
+    children, paths = node
+    for path in paths:
+        flat[path] = data
+
+    for step, child in children.items():
+        # Array indices only apply to lists and keys only to dicts, so e.g. a string value
+        # is never indexed into
+        if isinstance(step, int):
+            if not (isinstance(data, list) and step < len(data)):
+                continue
+        elif not (isinstance(data, dict) and step in data):
+            continue
+        _flatten(data[step], child, flat)
+
+    return flat
+
+
+@dataclass(slots=True)
+class CompiledCall:
+    """
+    An ApiCallValidation specialized once for execution, so validating a response does not
+    go through Pydantic attribute access or re-parse any field paths.
+    """
+    tool_name: str
+    arguments: Dict[str, Any]
+    field_checks: Tuple[Tuple[str, Any], ...]  # (field path, expected value) pairs
+    presence_checks: Tuple[str, ...]  # Field paths that should exist
+    path_trie: PathTrieNode  # Trie of every path in field_checks and presence_checks
+
+    def validate_response(self, response: Dict[str, Any]) -> bool:
+        """
+        Validates the response against the expected field values and presence.
+
+        Returns:
+            bool: True if validation passes, False otherwise
+        """
+        flat = _flatten(response, self.path_trie, {})
+        # A missing field is treated as None, both in field_checks and presence_checks
+        return all(
+            flat.get(field_path) == expected_value
+            for field_path, expected_value in self.field_checks
+        ) and all(
+            flat.get(field_path) is not None
+            for field_path in self.presence_checks
+        )
+
+
+@dataclass(slots=True)
+class CompiledPlan:
+    """
+    A StateValidationConfig compiled into the calls to execute.
+    """
+    calls: List[CompiledCall]
+    fail_fast: bool
 
 
 class ApiCallValidation(BaseModel):
@@ -27,6 +132,7 @@ class ApiCallValidation(BaseModel):
     - 'issues.0.summary': Accesses the summary field of the first issue in the issues array
     - 'issues.0.status.name': Accesses the name field within the status object of the first issue
     """
+    model_config = ConfigDict(frozen=True, extra='forbid')
     
     tool_name: str  # Name of the MCP tool to call for validation
     arguments: Dict[str, Any]  # Arguments to pass to the tool call
@@ -55,55 +161,25 @@ class ApiCallValidation(BaseModel):
         Returns:
             bool: True if validation passes, False otherwise
         """
-        # Check expected fields
-        if self.expected_fields:
-            for field_path, expected_value in self.expected_fields.items():
-                actual_value = self._get_nested_value(response, field_path)
-                if actual_value != expected_value:
-                    return False
-        
-        # Check field presence
-        if self.expected_field_presence:
-            for field_path in self.expected_field_presence:
-                if self._get_nested_value(response, field_path) is None:
-                    return False
-        
-        return True
-    
-    def _get_nested_value(self, data: Dict[str, Any], path: str) -> Any:
+        return self.compile().validate_response(response)
+
+    def compile(self) -> CompiledCall:
         """
-        Gets a value from a nested dictionary or list using dot notation.
-        
-        This method supports:
-        - Dictionary key access: 'user.name' accesses data['user']['name']
-        - Array index access: 'issues.0' accesses data['issues'][0]
-        - Mixed access: 'issues.0.status.name' accesses data['issues'][0]['status']['name']
-        
-        Args:
-            data: The dictionary or list to search in
-            path: The path to the value, using dot notation (e.g., 'issues.0.summary')
-            
-        Returns:
-            The value at the specified path, or None if any part of the path is not found
+        Compiles this validation into a CompiledCall. The result is cached on the instance.
         """
-        parts = path.split('.')
-        current = data
-        
-        for part in parts:
-            # Handle array indices
-            if part.isdigit():
-                index = int(part)
-                if isinstance(current, list) and 0 <= index < len(current):
-                    current = current[index]
-                else:
-                    return None
-            # Handle dictionary keys
-            elif isinstance(current, dict) and part in current:
-                current = current[part]
-            else:
-                return None
-        
-        return current
+        return self._compiled
+
+    @functools.cached_property
+    def _compiled(self) -> CompiledCall:
+        field_checks = tuple((self.expected_fields or {}).items())
+        presence_checks = tuple(self.expected_field_presence or ())
+        return CompiledCall(
+            tool_name=self.tool_name,
+            arguments=self.arguments,
+            field_checks=field_checks,
+            presence_checks=presence_checks,
+            path_trie=_build_path_trie([path for path, _ in field_checks] + list(presence_checks)),
+        )
 
 
 class StateValidationConfig(BaseModel):
@@ -120,13 +196,14 @@ class StateValidationConfig(BaseModel):
                 ApiCallValidation(
                     tool_name="jira_search",
                     arguments={"jql": "project = MBA", "limit": 1},
-                    expected_result_type="success",
-                    expected_fields={"issues.0.summary": "Expected Summary"}
+                    expected_fields={"issues.0.summary": "Expected Summary"},
+                    expected_field_presence=None,
                 )
             ],
             fail_fast=True
         )
     """
+    model_config = ConfigDict(frozen=True, extra='forbid')
     
     state_validation_calls: List[ApiCallValidation] = Field(
         description="List of API calls to validate the state",
@@ -137,3 +214,12 @@ class StateValidationConfig(BaseModel):
         default=False,
         description="If True, stop validation on first failure"
     )
+
+    def compile(self) -> CompiledPlan:
+        """
+        Compiles this config into a CompiledPlan, to be done once when the data is loaded.
+        """
+        return CompiledPlan(
+            calls=[validation.compile() for validation in self.state_validation_calls],
+            fail_fast=self.fail_fast,
+        )
@@ -1,10 +1,11 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class TaskContext(BaseModel):
     """
     Provides context about the task the trying to be accomplished.
     """
+    model_config = ConfigDict(frozen=True, extra='forbid')
     
     goal: str = Field(
         description="The overall goal trying to be achieved"
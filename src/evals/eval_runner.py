@@ -1,51 +1,139 @@
+import asyncio
+from typing import Optional
+
+from src.data.dataset_entities.state_validation import CompiledCall, CompiledPlan
 from src.jira_mcp_server.server import JiraMCPServer
 from src.agent import JiraMcpAgent
 from src.evals.load_data import NewEvalDataPoint
+from src.evals.trajectory import dump_trajectory
+
+DEFAULT_MAX_CONCURRENT_VALIDATIONS = 8
+DEFAULT_MAX_CONCURRENT_EVALS = 8
+
+
+async def _run_validation(
+        validation: CompiledCall,
+        mcp_server: JiraMCPServer,
+        semaphore: asyncio.Semaphore,
+) -> bool:
+    async with semaphore:
+        result = await mcp_server.call_tool_dict_resp(
+            name=validation.tool_name,
+            arguments=validation.arguments
+        )
+
+    return validation.validate_response(response=result)
+
+
+async def run_state_validations(
+        plan: CompiledPlan,
+        mcp_server: JiraMCPServer,
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT_VALIDATIONS,
+) -> bool:
+    """
+    Runs all state validation calls concurrently, as they are independent read-only queries.
+
+    Without `plan.fail_fast`, all calls are sent to the MCP server as one batch. With it,
+    each call is awaited individually so the remaining in-flight calls can be cancelled as
+    soon as one validation fails.
+
+    Returns:
+        bool: True if every validation passed, False otherwise
+    """
+    calls = plan.calls
+
+    if not plan.fail_fast:
+        responses = await mcp_server.batch_call_tool_dict_resp(
+            calls=[(validation.tool_name, validation.arguments) for validation in calls],
+            max_concurrent=max_concurrent,
+        )
+
+        all_valid = True
+        for validation, response in zip(calls, responses):
+            if not validation.validate_response(response=response):
+                all_valid = False
+                print(f"Validation failed for {validation.tool_name}.")
+        return all_valid
+
+    semaphore = asyncio.Semaphore(max_concurrent)
+    tasks = {
+        asyncio.create_task(_run_validation(validation, mcp_server, semaphore)): validation
+        for validation in calls
+    }
+
+    pending = set(tasks)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if not task.result():
+                    print(f"Validation failed for {tasks[task].tool_name}.")
+                    return False
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    return True
 
 
 async def run_single_eval(
         eval_dp: NewEvalDataPoint,
         agent: JiraMcpAgent,
         mcp_server: JiraMCPServer,
-):
-    trajectory = await agent.run(prompt=eval_dp.prompt)
-    print(f"Agent trajectory: {trajectory}")
-
-    if eval_dp.state_validation_config:
-        for validation in eval_dp.state_validation_config.state_validation_calls:
-            result = await mcp_server.call_tool_dict_resp(
-                name=validation.tool_name,
-                arguments=validation.arguments
-            )
-            
-            is_valid = validation.validate_response(response=result)
-
-            if eval_dp.state_validation_config.fail_fast and not is_valid:
-                print(f"Validation failed for {validation.tool_name}.")
-                ## TODO: Handle fail fast logic
-                pass
+        session_id: str = "session_id",
+) -> Optional[bool]:
+    """
+    Runs the agent on a single evaluation, then validates the resulting Jira state.
 
-        ## TODO: Do something with the validation results
+    Returns:
+        Optional[bool]: Whether the state validations passed, or None if there are none
+    """
+    trajectory = await agent.run(prompt=eval_dp.prompt, session_id=session_id)
+    # Logging the trajectory must not fail an otherwise successful run
+    try:
+        print(f"Agent trajectory: {dump_trajectory(trajectory).decode()}")
+    except (TypeError, ValueError) as e:
+        print(f"Agent trajectory (could not serialize to JSON: {e}): {trajectory!r}")
 
+    if not eval_dp.validation_plan:
+        return None
 
+    return await run_state_validations(
+        plan=eval_dp.validation_plan,
+        mcp_server=mcp_server,
+    )
 
 
 async def run_evals(
         agent: JiraMcpAgent,
         mcp_server: JiraMCPServer,
         eval_data_list: list[NewEvalDataPoint],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENT_EVALS,
 ):
-    for i, eval_data in enumerate(eval_data_list):
-        print(f"\nRunning evaluation {i+1}/{len(eval_data_list)}...")
-        try:
-            await run_single_eval(
-                eval_dp=eval_data,
-                agent=agent,
-                mcp_server=mcp_server
-            )
-        
-        except Exception as e:
-            print(f"Error running evaluation {i+1}: {e}")
-            continue
-
-        
\ No newline at end of file
+    """
+    Runs all evaluations concurrently, with at most `max_concurrency` in flight at once.
+
+    Each evaluation gets its own session so that concurrent agent runs do not share history.
+    """
+    session_ids = [f"session_{i}" for i in range(len(eval_data_list))]
+    agent.prewarm(session_ids)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _run(i: int, eval_data: NewEvalDataPoint):
+        async with semaphore:
+            print(f"\nRunning evaluation {i+1}/{len(eval_data_list)}...")
+            try:
+                is_valid = await run_single_eval(
+                    eval_dp=eval_data,
+                    agent=agent,
+                    mcp_server=mcp_server,
+                    session_id=session_ids[i],
+                )
+                if is_valid is not None:
+                    print(f"Evaluation {i+1} state validation {'passed' if is_valid else 'failed'}.")
+
+            except Exception as e:
+                print(f"Error running evaluation {i+1}: {e}")
+
+    await asyncio.gather(*(_run(i, eval_data) for i, eval_data in enumerate(eval_data_list)))
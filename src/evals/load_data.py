@@ -1,39 +1,54 @@
 import csv
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import os
-from typing import List
+from typing import List, Optional
 
-from src.data.dataset_entities.state_validation import ApiCallValidation, StateValidationConfig
+from src.data.dataset_entities.state_validation import ApiCallValidation, CompiledPlan, StateValidationConfig
 from src.data.dataset_entities.task_context import TaskContext
 
-@dataclass
+@dataclass(slots=True)
 class EvalDataPoint:
     prompt: str
     expected_tools: List[str]
     final_msg_facts: str
 
-async def load_eval_data(csv_file: str) -> List[EvalDataPoint]:
+def load_eval_data(csv_file: str) -> List[EvalDataPoint]:
     """Loads eval data from a CSV file."""
-    eval_data_list: List[EvalDataPoint] = []
     current_dir = os.path.dirname(os.path.abspath(__file__))
     csv_file = os.path.join(current_dir, csv_file)
     with open(csv_file, mode='r', encoding='utf-8') as csvfile:
-        reader = csv.DictReader(csvfile)
-        for row in reader:
-            eval_data = EvalDataPoint(
-                prompt=row['prompt'],
-                expected_tools=row['expected_tools'].split(','),
-                final_msg_facts=row['final_msg_facts']
+        reader = csv.reader(csvfile)
+        header = next(reader, None)
+        if header is None:
+            return []
+        i_prompt = header.index('prompt')
+        i_tools = header.index('expected_tools')
+        i_facts = header.index('final_msg_facts')
+        eval_data_list: List[EvalDataPoint] = [
+            EvalDataPoint(
+                prompt=row[i_prompt],
+                expected_tools=row[i_tools].split(','),
+                final_msg_facts=row[i_facts]
             )
-            eval_data_list.append(eval_data)
+            # csv.reader yields [] for blank lines, which DictReader skipped
+            for row in reader
+            if row
+        ]
     return eval_data_list
 
 
 
-@dataclass
+@dataclass(slots=True)
 class NewEvalDataPoint:
     task_context: TaskContext
     state_validation_config: StateValidationConfig
+    # Compiled from state_validation_config at load time, and used by the eval runner
+    validation_plan: Optional[CompiledPlan] = field(init=False)
+
+    def __post_init__(self):
+        self.validation_plan = (
+            self.state_validation_config.compile() if self.state_validation_config else None
+        )
 
     @property
     def prompt(self) -> str:
@@ -61,7 +76,6 @@ def load_example_dp() -> List[NewEvalDataPoint]:
                         "issues.0.status.name": "To Do"
                     },
                     expected_field_presence=["issues.0.key"],
-                    expected_field_absence=None
                 )
             ],
         ),
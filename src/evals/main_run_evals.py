@@ -10,11 +10,11 @@ import os
 import subprocess
 import sys
 from contextlib import AsyncExitStack
-from typing import Dict
+from typing import Dict, Union
 
 from dotenv import load_dotenv
 
-from src.evals.eval_runner import run_evals
+from src.evals.eval_runner import DEFAULT_MAX_CONCURRENT_EVALS, run_evals
 from src.agent import JiraMcpAgent
 from src.evals.load_data import EvalDataPoint, load_eval_data, load_example_dp
 from src.jira_mcp_server.server import JiraMCPServer
@@ -23,42 +23,52 @@ DOCKER_CONTAINER_NAME = "mcp-atlassian"
 USER_ID = "user_id"
 SESSION_ID = "session_id"
 DEFAULT_CSV_FILE = "eval_data.csv"
-REQUIRED_ENV_VARS = ["JIRA_URL", "JIRA_USERNAME", "JIRA_API_TOKEN", "LITE_LLM_MODEL_NAME"]
+SHUTDOWN_TIMEOUT_SECONDS = 2.0
+REQUIRED_ENV_VARS = ("JIRA_URL", "JIRA_USERNAME", "JIRA_API_TOKEN", "LITE_LLM_MODEL_NAME")
 
 
-def validate_environment() -> Dict[str, str]:
+def _positive_int_env(var: str, default: int) -> int:
+    value = os.environ.get(var, str(default))
+    if not value.isdigit() or int(value) < 1:
+        raise ValueError(f"{var} must be a positive integer, got '{value}'.")
+    return int(value)
+
+
+def validate_environment() -> Dict[str, Union[str, int]]:
     """
     Validate that all required environment variables are set.
     """
-    env_vars = {}
-    
-    for var in REQUIRED_ENV_VARS:
-        value = os.getenv(var)
-        if not value:
-            raise ValueError(f"Please set {var} in your environment variables.")
-        env_vars[var] = value
-    
-    env_vars["ENABLED_TOOLS"] = os.getenv("ENABLED_TOOLS", "")
+    missing = [var for var in REQUIRED_ENV_VARS if not os.environ.get(var)]
+    if missing:
+        raise ValueError(f"Please set {', '.join(missing)} in your environment variables.")
     
-    return env_vars
+    return {
+        **{var: os.environ[var] for var in REQUIRED_ENV_VARS},
+        "ENABLED_TOOLS": os.environ.get("ENABLED_TOOLS", ""),
+        "EVAL_CONCURRENCY": _positive_int_env("EVAL_CONCURRENCY", DEFAULT_MAX_CONCURRENT_EVALS),
+    }
 
 
-async def stop_docker_container() -> None:
-    try:
-        print(f"Removing container {DOCKER_CONTAINER_NAME}...")
-        subprocess.run(
-            ["docker", "rm", "-f", DOCKER_CONTAINER_NAME], 
-            check=True, 
-            capture_output=True
-        )
-        print(f"Container {DOCKER_CONTAINER_NAME} removed.")
-    except subprocess.CalledProcessError as e:
-        # It's okay if the container doesn't exist when trying to remove it
-        if "No such container" in str(e.stderr):
-            print(f"Container {DOCKER_CONTAINER_NAME} does not exist. Continuing...")
-        else:
-            print(f"Error managing Docker container: {e}")
-            raise
+async def stop_docker_container(container_name: str = DOCKER_CONTAINER_NAME) -> None:
+    print(f"Removing container {container_name}...")
+    cmd = ["docker", "rm", "-f", container_name]
+    # Run without blocking the event loop, so concurrent evals are not stalled
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stdout, stderr = await proc.communicate()
+
+    if proc.returncode == 0:
+        print(f"Container {container_name} removed.")
+    # It's okay if the container doesn't exist when trying to remove it
+    elif b"No such container" in stderr:
+        print(f"Container {container_name} does not exist. Continuing...")
+    else:
+        e = subprocess.CalledProcessError(proc.returncode, cmd, output=stdout, stderr=stderr)
+        print(f"Error managing Docker container: {e}")
+        raise e
 
 
 def load_dps_from_csv(csv_file: str) -> list[EvalDataPoint]:
@@ -78,34 +88,61 @@ async def main(csv_file: str = DEFAULT_CSV_FILE) -> None:
         print(f"Environment validation error: {e}")
         sys.exit(1)
     
-    async with AsyncExitStack() as stack:
+    # Remove any container left over from a previous run (its name would clash with the new
+    # one), overlapping the removal with loading the eval data
+    _, eval_data_list = await asyncio.gather(
+        stop_docker_container(),
+        asyncio.to_thread(load_example_dp),
+    )
+
+    stack = AsyncExitStack()
+    try:
+        # The container and MCP session are shared by every evaluation
         mcp_server = await JiraMCPServer.initialize(
             jira_url=env_vars["JIRA_URL"],
             jira_username=env_vars["JIRA_USERNAME"],
             jira_api_token=env_vars["JIRA_API_TOKEN"],
             enabled_tools=env_vars["ENABLED_TOOLS"],
             exit_stack=stack,
-            container_name=DOCKER_CONTAINER_NAME
+            container_name=DOCKER_CONTAINER_NAME,
         )
         mcp_tools = mcp_server.get_tools()
         agent = JiraMcpAgent(
             litellm_model_name=env_vars["LITE_LLM_MODEL_NAME"],
             tools=mcp_tools,
         )
-        eval_data_list = load_example_dp()
         await run_evals(
             agent=agent,
             mcp_server=mcp_server,
-            eval_data_list=eval_data_list
+            eval_data_list=eval_data_list,
+            max_concurrency=env_vars["EVAL_CONCURRENCY"],
         )
         
         print("\nAll evaluations completed.\n\n\n\n\n\n\n\n\n\n\n\n\n")
-        await stop_docker_container()
-    
-        # Exit cleanly due to the hanging container issue
-        sys.exit(0)
-
+    finally:
+        # Closing the exit stack sends SIGTERM to the stdio `docker run` child, which forwards
+        # it to the container and exits once the container has stopped (and been removed, due
+        # to `--rm`). Only fall back to `docker rm -f` if that fails or does not finish in time.
+        # A slow shutdown is recovered by the fallback, but any other failure is re-raised so the
+        # run exits non-zero.
+        try:
+            async with asyncio.timeout(SHUTDOWN_TIMEOUT_SECONDS):
+                await stack.aclose()
+        except TimeoutError:
+            print("Timed out waiting for the MCP server container to stop.")
+            await stop_docker_container()
+        except Exception as e:
+            print(f"Failed to stop the MCP server container cleanly: {e!r}")
+            await stop_docker_container()
+            raise
 
 if __name__ == "__main__":
     csv_file_arg = sys.argv[1] if len(sys.argv) > 1 else None
+    # uvloop is optional (the `uvloop` extra) and unavailable on Windows; fall back to the
+    # default event loop
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
     asyncio.run(main(csv_file_arg))
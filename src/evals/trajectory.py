@@ -1,38 +1,158 @@
-import collections.abc
-from typing import Any, Optional, List, Literal, Dict
-from pydantic import BaseModel, Field, ConfigDict
+import dataclasses
+from dataclasses import dataclass
+import sys
+from typing import Any, Iterator, Optional, List, Literal, Dict, Tuple, Union
+from pydantic import BaseModel, ConfigDict
 from google.adk.events.event import Event
+from google.genai import types
+from mcp.types import CallToolResult
+
+from src import json_utils
+
+# Message roles, as shared singletons so every record references the same three strings
+ROLE_USER = sys.intern("user")
+ROLE_ASSISTANT = sys.intern("assistant")
+ROLE_TOOL = sys.intern("tool")
 
 
 class LlmToolCall(BaseModel):
     model_config = ConfigDict(extra='forbid')
-    call_id: Optional[str] = Field(default=None, description="Unique ID for the tool call, if provided by the LLM.")
-    name: str = Field(description="The name of the function/tool to be called.")
-    args: dict[str, Any] = Field(description="The arguments for the tool call.")
+    # Unique ID for the tool call, if provided by the LLM.
+    call_id: Optional[str] = None
+    # The name of the function/tool to be called.
+    name: str
+    # The arguments for the tool call.
+    args: dict[str, Any]
 
 
 class ToolResult(BaseModel):
     model_config = ConfigDict(extra='forbid')
-    call_id: Optional[str] = Field(default=None, description="ID of the LlmToolCall this result corresponds to, if available.")
-    name: str = Field(description="The name of the function/tool that was executed.")
-    result_data: dict[str, Any] = Field(description="The data returned by the tool execution.")
-    is_error: bool = Field(default=False, description="True if the tool execution resulted in an error.")
+    # ID of the LlmToolCall this result corresponds to, if available.
+    call_id: Optional[str] = None
+    # The name of the function/tool that was executed.
+    name: str
+    # The data returned by the tool execution.
+    result_data: dict[str, Any]
+    # True if the tool execution resulted in an error.
+    is_error: bool = False
 
 
 class Message(BaseModel):
     model_config = ConfigDict(extra='forbid')
-    timestamp: float = Field(description="Timestamp of the original event.")
-    author: str = Field(description="'user' or the name of the agent who authored the original event.")
-    role: Literal["user", "assistant", "tool"] = Field(description="The role of the entity that produced this message.")
-    user_text_input: Optional[str] = Field(default=None, description="Text input from the user. (Populated if role='user')")
-    assistant_text_response: Optional[str] = Field(default=None, description="Textual response from the LLM. (Populated if role='assistant')")
-    assistant_tool_calls: Optional[List[LlmToolCall]] = Field(default=None, description="Tool calls requested by the LLM. (Populated if role='assistant')")
-    tool_results: Optional[List[ToolResult]] = Field(default=None, description="Results of tool executions. (Populated if role='tool')")
+    # Timestamp of the original event.
+    timestamp: float
+    # 'user' or the name of the agent who authored the original event.
+    author: str
+    # The role of the entity that produced this message.
+    role: Literal["user", "assistant", "tool"]
+    # Text input from the user. (Populated if role='user')
+    user_text_input: Optional[str] = None
+    # Textual response from the LLM. (Populated if role='assistant')
+    assistant_text_response: Optional[str] = None
+    # Tool calls requested by the LLM. (Populated if role='assistant')
+    assistant_tool_calls: Optional[List[LlmToolCall]] = None
+    # Results of tool executions. (Populated if role='tool')
+    tool_results: Optional[List[ToolResult]] = None
 
 
 class Trajectory(BaseModel):
     model_config = ConfigDict(extra='forbid')
     messages: List[Message]
+    # Why the run was cut short, if it was (e.g. 'tool_loop').
+    terminated_reason: Optional[str] = None
+
+
+@dataclass(slots=True)
+class LlmToolCallRecord:
+    """Lightweight, unvalidated counterpart of LlmToolCall, used while building trajectories."""
+    call_id: Optional[str]
+    name: str
+    args: dict[str, Any]
+
+
+@dataclass(slots=True)
+class ToolResultRecord:
+    """Lightweight, unvalidated counterpart of ToolResult, used while building trajectories."""
+    call_id: Optional[str]
+    name: str
+    result_data: dict[str, Any]
+    is_error: bool = False
+
+
+@dataclass(slots=True)
+class MessageRecord:
+    """Lightweight, unvalidated counterpart of Message, used while building trajectories."""
+    timestamp: float
+    author: str
+    role: Literal["user", "assistant", "tool"]
+    user_text_input: Optional[str] = None
+    assistant_text_response: Optional[str] = None
+    assistant_tool_calls: Optional[List[LlmToolCallRecord]] = None
+    tool_results: Optional[List[ToolResultRecord]] = None
+
+
+@dataclass(slots=True)
+class TrajectoryRecord:
+    """
+    Trajectory as built from agent events. It avoids Pydantic's per-instance overhead on the
+    hot path; call `to_pydantic()` where the validated Trajectory model is needed.
+    """
+    messages: List[MessageRecord]
+    terminated_reason: Optional[str] = None
+
+    def to_pydantic(self) -> Trajectory:
+        """Convert to a Trajectory, without re-validating the (trusted) records."""
+        return Trajectory.model_construct(
+            messages=[_message_to_pydantic(message) for message in self.messages],
+            terminated_reason=self.terminated_reason,
+        )
+
+
+# Records come from trusted ADK objects, so they are converted with `model_construct` to skip
+# validation. These are the fields set by each kind of conversion.
+_MESSAGE_FIELDS_BY_ROLE = {
+    ROLE_USER: frozenset({"timestamp", "author", "role", "user_text_input"}),
+    ROLE_TOOL: frozenset({"timestamp", "author", "role", "tool_results"}),
+    ROLE_ASSISTANT: frozenset({"timestamp", "author", "role", "assistant_text_response", "assistant_tool_calls"}),
+}
+_TOOL_RESULT_FIELDS = frozenset({"call_id", "name", "result_data", "is_error"})
+_TOOL_CALL_FIELDS = frozenset({"call_id", "name", "args"})
+
+
+def _message_to_pydantic(message: MessageRecord) -> Message:
+    tool_calls = message.assistant_tool_calls
+    tool_results = message.tool_results
+    return Message.model_construct(
+        _fields_set=set(_MESSAGE_FIELDS_BY_ROLE[message.role]),
+        timestamp=message.timestamp,
+        author=message.author,
+        role=message.role,
+        user_text_input=message.user_text_input,
+        assistant_text_response=message.assistant_text_response,
+        assistant_tool_calls=[
+            LlmToolCall.model_construct(
+                _fields_set=set(_TOOL_CALL_FIELDS),
+                call_id=tool_call.call_id,
+                name=tool_call.name,
+                args=tool_call.args,
+            )
+            for tool_call in tool_calls
+        ] if tool_calls is not None else None,
+        tool_results=[
+            ToolResult.model_construct(
+                _fields_set=set(_TOOL_RESULT_FIELDS),
+                call_id=tool_result.call_id,
+                name=tool_result.name,
+                result_data=tool_result.result_data,
+                is_error=tool_result.is_error,
+            )
+            for tool_result in tool_results
+        ] if tool_results is not None else None,
+    )
+
+
+# (concatenated text, function calls, function responses) of an event
+ClassifiedParts = Tuple[str, List[types.FunctionCall], List[types.FunctionResponse]]
 
 
 def extract_event_metadata(event: Event) -> Dict[str, Any]:
@@ -43,61 +163,76 @@ def extract_event_metadata(event: Event) -> Dict[str, Any]:
     }
 
 
-def extract_text_from_parts(event: Event, exclude_function_parts: bool = True) -> List[str]:
-    """Extract text parts from an event, optionally excluding function-related parts."""
-    text_parts = []
-    
-    if not (event.content and event.content.parts):
-        return text_parts
-        
-    for part in event.content.parts:
-        has_text = part.text is not None
-        is_function_part = part.function_call or part.function_response
-        
-        if has_text and (not exclude_function_parts or not is_function_part):
+def _classify_parts(event: Event) -> ClassifiedParts:
+    """
+    Split an event's parts into their concatenated text (excluding function-related parts),
+    function calls and function responses, in a single pass.
+    """
+    text_parts: List[str] = []
+    function_calls: List[types.FunctionCall] = []
+    function_responses: List[types.FunctionResponse] = []
+
+    content = event.content
+    parts = content.parts if content else None
+    if not parts:
+        return "", function_calls, function_responses
+
+    for part in parts:
+        function_call = part.function_call
+        function_response = part.function_response
+
+        if function_call:
+            function_calls.append(function_call)
+        if function_response:
+            function_responses.append(function_response)
+        if part.text is not None and not (function_call or function_response):
             text_parts.append(part.text)
-            
-    return text_parts
+
+    return "".join(text_parts), function_calls, function_responses
 
 
-def process_user_message(event: Event, event_metadata: Dict[str, Any]) -> Optional[Message]:
+def process_user_message(event: Event, event_metadata: Dict[str, Any], classified_parts: ClassifiedParts) -> Optional[MessageRecord]:
     """Process a user event and extract a user message if present."""
     if event.author != "user":
         return None
         
-    text_parts = extract_text_from_parts(event)
+    text, _, _ = classified_parts
     
-    if not text_parts:
+    if not text:
         return None
         
-    return Message(
+    return MessageRecord(
         **event_metadata,
-        role="user",
-        user_text_input="".join(text_parts)
+        role=ROLE_USER,
+        user_text_input=text
     )
 
 
-def create_tool_result(function_response: Any) -> Optional[ToolResult]:
-    """Create a ToolResult from a function response."""
-    if function_response.name is None or function_response.response is None:
+def create_tool_result(function_response: Any) -> Optional[ToolResultRecord]:
+    """Create a ToolResultRecord from a function response."""
+    name = function_response.name
+    response = function_response.response
+    if name is None or response is None:
         return None
         
-    is_error = (
-        isinstance(function_response.response, collections.abc.Mapping) and 
-        "error" in function_response.response
-    )
+    # FunctionResponse.response is always a plain dict, so avoid the slower ABC isinstance check
+    is_error = False
+    if isinstance(response, dict):
+        # ADK wraps MCP tool output as {"result": CallToolResult}, which flags a failed call itself
+        result = response.get("result")
+        is_error = "error" in response or (isinstance(result, CallToolResult) and result.isError)
     
-    return ToolResult(
+    return ToolResultRecord(
         call_id=function_response.id,
-        name=function_response.name,
-        result_data=function_response.response,
+        name=name,
+        result_data=response,
         is_error=is_error
     )
 
 
-def process_tool_responses(event: Event, event_metadata: Dict[str, Any]) -> Optional[Message]:
+def process_tool_responses(event: Event, event_metadata: Dict[str, Any], classified_parts: ClassifiedParts) -> Optional[MessageRecord]:
     """Process tool responses from an event and create a tool message if present."""
-    function_responses = event.get_function_responses()
+    _, _, function_responses = classified_parts
     if not function_responses:
         return None
         
@@ -111,34 +246,35 @@ def process_tool_responses(event: Event, event_metadata: Dict[str, Any]) -> Opti
     if not tool_results:
         return None
         
-    return Message(
+    return MessageRecord(
         **event_metadata,
-        role="tool",
+        role=ROLE_TOOL,
         tool_results=tool_results
     )
 
 
-def create_tool_call(function_call: Any) -> Optional[LlmToolCall]:
-    """Create an LlmToolCall from a function call."""
-    if function_call.name is None or function_call.args is None:
+def create_tool_call(function_call: Any) -> Optional[LlmToolCallRecord]:
+    """Create an LlmToolCallRecord from a function call."""
+    name = function_call.name
+    args = function_call.args
+    if name is None or args is None:
         return None
         
-    return LlmToolCall(
+    return LlmToolCallRecord(
         call_id=function_call.id,
-        name=function_call.name,
-        args=function_call.args
+        name=name,
+        args=args
     )
 
 
-def process_assistant_message(event: Event, event_metadata: Dict[str, Any]) -> Optional[Message]:
+def process_assistant_message(event: Event, event_metadata: Dict[str, Any], classified_parts: ClassifiedParts) -> Optional[MessageRecord]:
     """Process an assistant event and extract an assistant message if present."""
     if event.author == "user":
         return None
         
-    text_parts = extract_text_from_parts(event)
-    text_response = "".join(text_parts) if text_parts else None
+    text, function_calls, _ = classified_parts
+    text_response = text or None
     
-    function_calls = event.get_function_calls()
     tool_calls = []
     
     if function_calls:
@@ -150,31 +286,83 @@ def process_assistant_message(event: Event, event_metadata: Dict[str, Any]) -> O
     if not (text_response or tool_calls):
         return None
         
-    return Message(
+    return MessageRecord(
         **event_metadata,
-        role="assistant",
+        role=ROLE_ASSISTANT,
         assistant_text_response=text_response,
         assistant_tool_calls=tool_calls if tool_calls else None
     )
 
 
-def parse_events_to_trajectory(events: List[Event]) -> Trajectory:
-    """Convert a list of Event objects into a Trajectory with structured messages."""
-    trajectory_messages = []
+def _extract_messages(event: Event) -> Iterator[MessageRecord]:
+    """Yield the user, tool and assistant messages (in that order) present in an event."""
+    event_metadata = extract_event_metadata(event)
+    classified_parts = _classify_parts(event)
 
-    for event in events:
-        event_metadata = extract_event_metadata(event)
-        
-        user_message = process_user_message(event, event_metadata)
-        if user_message:
-            trajectory_messages.append(user_message)
-            
-        tool_message = process_tool_responses(event, event_metadata)
-        if tool_message:
-            trajectory_messages.append(tool_message)
-            
-        assistant_message = process_assistant_message(event, event_metadata)
-        if assistant_message:
-            trajectory_messages.append(assistant_message)
-                
-    return Trajectory(messages=trajectory_messages)
+    user_message = process_user_message(event, event_metadata, classified_parts)
+    if user_message:
+        yield user_message
+
+    tool_message = process_tool_responses(event, event_metadata, classified_parts)
+    if tool_message:
+        yield tool_message
+
+    assistant_message = process_assistant_message(event, event_metadata, classified_parts)
+    if assistant_message:
+        yield assistant_message
+
+
+class TrajectoryBuilder:
+    """Incrementally builds a TrajectoryRecord from events as they are produced."""
+
+    def __init__(self, initial_message: Optional[MessageRecord] = None):
+        self._messages: List[MessageRecord] = [initial_message] if initial_message else []
+
+    def add_event(self, event: Event) -> List[MessageRecord]:
+        """
+        Convert a single Event into structured messages and append them to the trajectory.
+
+        Returns:
+            The messages added for this event.
+        """
+        new_messages = list(_extract_messages(event))
+        self._messages.extend(new_messages)
+        return new_messages
+
+    def finish(self, terminated_reason: Optional[str] = None) -> TrajectoryRecord:
+        """Return the trajectory built from all events added so far."""
+        return TrajectoryRecord(messages=self._messages, terminated_reason=terminated_reason)
+
+
+def parse_events_to_trajectory(events: List[Event]) -> TrajectoryRecord:
+    """Convert a list of Event objects into a trajectory with structured messages."""
+    trajectory_messages = [message for event in events for message in _extract_messages(event)]
+    return TrajectoryRecord(messages=trajectory_messages)
+
+
+def parse_trajectory_json(data: bytes) -> Trajectory:
+    """Parse and validate a Trajectory from external JSON, e.g. a saved trajectory file."""
+    return Trajectory.model_validate_json(data)
+
+
+# This module's models forbid extra fields, so only their declared fields are in __dict__
+_TRAJECTORY_MODELS = frozenset({LlmToolCall, ToolResult, Message, Trajectory})
+
+
+def _asdict(obj: Any) -> Any:
+    """Unwrap the objects in a trajectory that the JSON encoder can't serialize directly."""
+    if type(obj) in _TRAJECTORY_MODELS:
+        return obj.__dict__
+    if isinstance(obj, BaseModel):
+        # Other models, e.g. the MCP results in tool result data, may allow extra fields
+        # or use aliases such as `_meta`
+        return obj.model_dump(mode="json", by_alias=True)
+    if dataclasses.is_dataclass(obj):
+        return dataclasses.asdict(obj)
+    # e.g. an AnyUrl in a tool result
+    return str(obj)
+
+
+def dump_trajectory(trajectory: Union[Trajectory, TrajectoryRecord]) -> bytes:
+    """Serialize a trajectory to JSON, without walking the Pydantic schema."""
+    return json_utils.dumps(trajectory, default=_asdict)
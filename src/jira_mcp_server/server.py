@@ -1,14 +1,17 @@
+import asyncio
 from contextlib import AsyncExitStack
-import json
-from typing import Dict, Any, List
-
+import functools
+import time
+from typing import ClassVar, Dict, Any, List, Optional, Tuple
 
+import anyio
 from google.adk.tools.mcp_tool.mcp_session_manager import MCPSessionManager, StdioServerParameters
 from google.adk.tools.mcp_tool import MCPTool
 from mcp import ListToolsResult
 from mcp.client.session import ClientSession
 from mcp.types import CallToolResult, TextContent
 
+from src import json_utils
 
 APP_NAME = "jira_mcp_agent"
 
@@ -16,11 +19,20 @@ APP_NAME = "jira_mcp_agent"
 class JiraMCPServer:
     """
     Manages an MCP server instance for interacting with Jira tools.
+
+    A single container and client session are shared by the agent's tools and all
+    validation calls for the lifetime of the instance. The session multiplexes concurrent
+    requests by their JSON-RPC id, so it is not a bottleneck for concurrent evaluations.
+    The session is only re-created if the connection to the server is lost, in a task of its
+    own that is stopped when the exit stack passed to `initialize()` is closed.
     """
     _mcp_session_manager: MCPSessionManager
     _client_session: ClientSession
     _tools: List[MCPTool]
 
+    # ListTools responses keyed by (jira_url, enabled_tools, container_name), with their expiry time
+    _list_tools_cache: ClassVar[Dict[Tuple[str, str, str], Tuple[ListToolsResult, float]]] = {}
+
     def __init__(
         self, 
         mcp_session_manager: MCPSessionManager, 
@@ -34,6 +46,9 @@ class JiraMCPServer:
         self._mcp_session_manager = mcp_session_manager
         self._client_session = client_session
         self._tools = tools
+        self._reconnect_lock = asyncio.Lock()
+        self._reconnect_tasks: List[asyncio.Task] = []
+        self._closing = asyncio.Event()
 
     @classmethod
     async def initialize(
@@ -44,11 +59,22 @@ class JiraMCPServer:
         enabled_tools: str,
         exit_stack: AsyncExitStack,
         container_name: str = "mcp-atlassian",
+        tools_cache_ttl_seconds: float = 300,
     ) -> 'JiraMCPServer':
         """
         Initializes the MCP server in a Docker container and returns an instance
         of JiraMCPServer.
+
+        The ListTools response is cached per (jira_url, enabled_tools, container_name) for
+        `tools_cache_ttl_seconds`, so re-initializing against the same server skips the request.
         """
+        docker_env={
+            "JIRA_URL": jira_url,
+            "JIRA_USERNAME": jira_username,
+            "JIRA_API_TOKEN": jira_api_token,
+            "ENABLED_TOOLS": enabled_tools,
+        }
+
         docker_args=[
             "run",
             "--rm",
@@ -61,13 +87,6 @@ class JiraMCPServer:
             "ghcr.io/sooperset/mcp-atlassian:latest",
         ]
 
-        docker_env={
-            "JIRA_URL": jira_url,
-            "JIRA_USERNAME": jira_username,
-            "JIRA_API_TOKEN": jira_api_token,
-            "ENABLED_TOOLS": enabled_tools,
-        }
-
         conn_params = StdioServerParameters(
             command="docker",
             args=docker_args,
@@ -78,26 +97,55 @@ class JiraMCPServer:
             connection_params=conn_params,
             exit_stack=exit_stack,
         )
-
         client_session = await mcp_session_manager.create_session()
 
-        tools_response: ListToolsResult = await client_session.list_tools()
+        tools_response = await cls._list_tools(
+            client_session=client_session,
+            cache_key=(jira_url, enabled_tools, container_name),
+            ttl_seconds=tools_cache_ttl_seconds,
+        )
         # As used in google.adk.tools.mcp_toolset `MCPToolset.load_tools()` func
-        mcp_tools = [
-            MCPTool(
-                mcp_tool=tool,
-                mcp_session=client_session,
-                mcp_session_manager=mcp_session_manager,
-            )
-            for tool in tools_response.tools
-        ]
+        make_tool = functools.partial(
+            MCPTool,
+            mcp_session=client_session,
+            mcp_session_manager=mcp_session_manager,
+        )
+        tools = tools_response.tools
+        mcp_tools = [make_tool(mcp_tool=tool) for tool in tools]
 
-        return cls(
+        server = cls(
             mcp_session_manager=mcp_session_manager,
             client_session=client_session,
             tools=mcp_tools,
         )
+        exit_stack.push_async_callback(server._close_reconnected_sessions)
+        # MCPTool.run_async reconnects through `_reinitialize_session` when it finds its session
+        # closed. Route that through the server, so the tool does not start a second container
+        # of the same name and stays on the shared session.
+        for tool in mcp_tools:
+            tool._reinitialize_session = functools.partial(server._reinitialize_tool_session, tool)
+        return server
     
+    @classmethod
+    async def _list_tools(
+        cls,
+        client_session: ClientSession,
+        cache_key: Tuple[str, str, str],
+        ttl_seconds: float,
+    ) -> ListToolsResult:
+        """
+        Returns the ListTools response for the server, using the cached one while it is fresh.
+        """
+        cached = cls._list_tools_cache.get(cache_key)
+        if cached is not None:
+            tools_response, expires_at = cached
+            if time.monotonic() < expires_at:
+                return tools_response
+
+        tools_response = await client_session.list_tools()
+        cls._list_tools_cache[cache_key] = (tools_response, time.monotonic() + ttl_seconds)
+        return tools_response
+
     def get_tools(self) -> List[MCPTool]:
         """
         Returns the list of tools available in the MCP server.
@@ -114,15 +162,121 @@ class JiraMCPServer:
         if not self._client_session:
             raise RuntimeError("JiraMCPServer not initialized. Call initialize() first.")
         
-        return await self._client_session.call_tool(name=name, arguments=arguments)
+        client_session = self._client_session
+        try:
+            return await client_session.call_tool(name=name, arguments=arguments)
+        except (anyio.ClosedResourceError, ConnectionError):
+            await self._reinitialize_session(closed_session=client_session)
+            return await self._client_session.call_tool(name=name, arguments=arguments)
+
+    async def _reinitialize_session(self, closed_session: ClientSession) -> None:
+        """
+        Re-creates the client session after the connection to the MCP server was lost.
+        Concurrent callers that saw the same closed session only reconnect once.
+
+        The agent's tools are moved onto the new session too, so they keep sharing one
+        connection with the validation calls rather than each opening their own.
+        """
+        async with self._reconnect_lock:
+            if self._client_session is closed_session:
+                self._client_session = await self._open_reconnected_session()
+                for tool in self._tools:
+                    if tool.mcp_session is closed_session:
+                        tool.mcp_session = self._client_session
+
+    async def _reinitialize_tool_session(self, tool: MCPTool) -> None:
+        """
+        Reconnects an agent tool that found its session closed, via the server's shared session.
+        """
+        await self._reinitialize_session(closed_session=tool.mcp_session)
+        # The session may have been re-created before this tool saw it was closed
+        tool.mcp_session = self._client_session
+
+    async def _open_reconnected_session(self) -> ClientSession:
+        """
+        Opens a new session in a dedicated task, which keeps it open until the server is closed.
+
+        The stdio transport holds an anyio task group that must be exited by the task that
+        entered it. The caller is whichever eval or validation task hit the closed session, so
+        entering the transport on the shared exit stack from here would fail when it is closed.
+        """
+        ready: asyncio.Future[ClientSession] = asyncio.get_running_loop().create_future()
+        self._reconnect_tasks.append(
+            asyncio.create_task(self._run_reconnected_session(ready))
+        )
+        return await ready
+
+    async def _run_reconnected_session(self, ready: asyncio.Future[ClientSession]) -> None:
+        session_manager = self._mcp_session_manager
+        try:
+            async with AsyncExitStack() as exit_stack:
+                session = await MCPSessionManager.initialize_session(
+                    connection_params=session_manager.connection_params,
+                    exit_stack=exit_stack,
+                    errlog=session_manager.errlog,
+                )
+                if not ready.done():
+                    ready.set_result(session)
+                await self._closing.wait()
+        except Exception as e:
+            if ready.done():
+                raise
+            ready.set_exception(e)
+
+    async def _close_reconnected_sessions(self) -> None:
+        self._closing.set()
+        await asyncio.gather(*self._reconnect_tasks)
 
     async def call_tool_dict_resp(self, name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """
         Calls a tool on the connected MCP server and returns the response as a dictionary.
         """
-        if not self._client_session:
-            raise RuntimeError("JiraMCPServer not initialized. Call initialize() first.")
-        
-        result = await self._client_session.call_tool(name=name, arguments=arguments)
+        result = await self.call_tool(name=name, arguments=arguments)
+        return self._result_to_dict(result)
+
+    async def batch_call_tool(
+        self,
+        calls: List[Tuple[str, Dict[str, Any]]],
+        max_concurrent: Optional[int] = None,
+    ) -> List[CallToolResult]:
+        """
+        Calls multiple independent tools concurrently on the connected MCP server.
+
+        Args:
+            calls: (tool name, arguments) pairs to call.
+            max_concurrent: Maximum number of calls in flight at once. Unbounded if None.
+
+        Returns:
+            The results, in the same order as `calls`. If a call fails, the rest are cancelled
+            and its exception is raised.
+        """
+        semaphore = asyncio.Semaphore(max_concurrent or len(calls) or 1)
+
+        async def _call(name: str, arguments: Dict[str, Any]) -> CallToolResult:
+            async with semaphore:
+                return await self.call_tool(name=name, arguments=arguments)
+
+        tasks = [asyncio.create_task(_call(name, arguments)) for name, arguments in calls]
+        try:
+            return await asyncio.gather(*tasks)
+        finally:
+            # If a call failed, don't leave the others running against the session
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def batch_call_tool_dict_resp(
+        self,
+        calls: List[Tuple[str, Dict[str, Any]]],
+        max_concurrent: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Calls multiple independent tools concurrently and returns each response as a dictionary.
+        """
+        results = await self.batch_call_tool(calls=calls, max_concurrent=max_concurrent)
+        return [self._result_to_dict(result) for result in results]
+
+    @staticmethod
+    def _result_to_dict(result: CallToolResult) -> Dict[str, Any]:
         content: TextContent = result.content[0]
-        return json.loads(content.text)
\ No newline at end of file
+        return json_utils.loads(content.text)
@@ -0,0 +1,41 @@
+"""
+JSON encoding and decoding, using orjson when it is installed and the stdlib json otherwise.
+"""
+
+import json
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Deserializes JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(
+    obj: Any,
+    default: Optional[Callable[[Any], Any]] = None,
+    sort_keys: bool = False,
+) -> bytes:
+    """
+    Serializes an object to UTF-8 encoded JSON.
+
+    Args:
+        obj: The object to serialize. Dataclasses are serialized natively by orjson,
+             otherwise via `default`.
+        default: Called for objects that can't otherwise be serialized, returning a
+                 serializable object.
+        sort_keys: Whether to sort dictionary keys.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=default, option=option)
+    return json.dumps(obj, default=default, sort_keys=sort_keys).encode()
@@ -0,0 +1,66 @@
+import asyncio
+from contextlib import asynccontextmanager
+import json
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import anyio
+from mcp.types import CallToolResult, ListToolsResult, TextContent, Tool
+
+
+class FakeClientSession:
+    """
+    Stands in for an MCP ClientSession. Each tool call sleeps for its delay, then fails if
+    the tool is in `failing` or returns `{"name": <tool name>}` as the JSON response.
+    Once `closed` is set, calls raise ClosedResourceError as for a lost connection.
+    """
+
+    def __init__(self, delays: Optional[Dict[str, float]] = None, failing: tuple = ()):
+        self.delays = delays or {}
+        self.failing = failing
+        self.called: List[str] = []
+        self.cancelled: List[str] = []
+        self.closed = False
+
+    async def list_tools(self) -> ListToolsResult:
+        return ListToolsResult(tools=[Tool(name="echo", inputSchema={"type": "object"})])
+
+    async def call_tool(self, name: str, arguments: Dict[str, Any]) -> CallToolResult:
+        if self.closed:
+            raise anyio.ClosedResourceError()
+        self.called.append(name)
+        try:
+            await asyncio.sleep(self.delays.get(name, 0))
+        except asyncio.CancelledError:
+            self.cancelled.append(name)
+            raise
+        if name in self.failing:
+            raise RuntimeError(f"{name} failed")
+        return CallToolResult(content=[TextContent(type="text", text=json.dumps({"name": name}))])
+
+
+class FakeSessionFactory:
+    """
+    Stands in for `MCPSessionManager.initialize_session`. Each session is entered on the given
+    exit stack, recording the tasks that open and close its transport.
+    """
+
+    def __init__(self):
+        self.sessions: List[FakeClientSession] = []
+        self.opened_in: List[asyncio.Task] = []
+        self.closed_in: List[asyncio.Task] = []
+
+    async def __call__(self, *, connection_params, exit_stack, errlog=None) -> FakeClientSession:
+        # A reconnect waits on the session like a real server handshake, giving concurrent
+        # callers the chance to see the same closed session
+        await asyncio.sleep(0.01)
+        return await exit_stack.enter_async_context(self._transport())
+
+    @asynccontextmanager
+    async def _transport(self) -> AsyncIterator[FakeClientSession]:
+        session = FakeClientSession()
+        self.sessions.append(session)
+        self.opened_in.append(asyncio.current_task())
+        try:
+            yield session
+        finally:
+            self.closed_in.append(asyncio.current_task())
@@ -0,0 +1,52 @@
+from google.adk.events.event import Event
+from google.genai import types
+from mcp.types import CallToolResult, TextContent
+
+from src.agent import TOOL_LOOP_THRESHOLD, _ToolLoopDetector
+from src.evals.trajectory import TrajectoryBuilder
+
+
+def _tool_round(call_id: str, is_error: bool) -> list[Event]:
+    """The agent's call to jira_get_issue and ADK's wrapped MCP result for it."""
+    args = {"issue_key": "MBA-1"}
+    result = CallToolResult(
+        content=[TextContent(type="text", text="Issue MBA-1 not found")],
+        isError=is_error,
+    )
+    return [
+        Event(
+            author="JiraMCPAgent",
+            content=types.Content(role="model", parts=[
+                types.Part(function_call=types.FunctionCall(id=call_id, name="jira_get_issue", args=args)),
+            ]),
+        ),
+        Event(
+            author="JiraMCPAgent",
+            content=types.Content(role="user", parts=[
+                types.Part(function_response=types.FunctionResponse(
+                    id=call_id, name="jira_get_issue", response={"result": result},
+                )),
+            ]),
+        ),
+    ]
+
+
+def _observe_rounds(is_error: bool) -> list[bool]:
+    builder = TrajectoryBuilder()
+    detector = _ToolLoopDetector()
+    fired = []
+    for i in range(TOOL_LOOP_THRESHOLD):
+        for event in _tool_round(call_id=f"call_{i}", is_error=is_error):
+            fired.append(detector.observe(builder.add_event(event)))
+    return fired
+
+
+def test_repeated_failing_mcp_result_is_detected_as_loop():
+    fired = _observe_rounds(is_error=True)
+
+    assert fired[-1]
+    assert not any(fired[:-1])
+
+
+def test_repeated_successful_mcp_result_is_not_a_loop():
+    assert not any(_observe_rounds(is_error=False))
@@ -0,0 +1,54 @@
+import asyncio
+
+from src.data.dataset_entities.state_validation import ApiCallValidation, StateValidationConfig
+from src.evals.eval_runner import run_state_validations
+from src.jira_mcp_server.server import JiraMCPServer
+from tests.fake_mcp import FakeClientSession
+
+
+def _validation(tool_name: str, expected_name: str) -> ApiCallValidation:
+    return ApiCallValidation(
+        tool_name=tool_name,
+        arguments={},
+        expected_fields={"name": expected_name},
+        expected_field_presence=None,
+    )
+
+
+def _run(session: FakeClientSession, fail_fast: bool) -> tuple[bool, list[str]]:
+    """Runs the validations, returning the result and the calls cancelled by then."""
+    plan = StateValidationConfig(
+        state_validation_calls=[
+            _validation("slow_1", "slow_1"),
+            _validation("wrong", "something else"),
+            _validation("slow_2", "slow_2"),
+        ],
+        fail_fast=fail_fast,
+    ).compile()
+    server = JiraMCPServer(mcp_session_manager=None, client_session=session, tools=[])
+
+    async def _validate() -> tuple[bool, list[str]]:
+        is_valid = await run_state_validations(plan=plan, mcp_server=server)
+        # Checked before the event loop closes, which would cancel any leftover calls itself
+        return is_valid, sorted(session.cancelled)
+
+    return asyncio.run(_validate())
+
+
+def test_fail_fast_returns_false_and_cancels_pending_calls():
+    session = FakeClientSession(delays={"slow_1": 1, "wrong": 0.01, "slow_2": 1})
+
+    is_valid, cancelled = _run(session, fail_fast=True)
+
+    assert not is_valid
+    assert cancelled == ["slow_1", "slow_2"]
+
+
+def test_without_fail_fast_every_call_completes():
+    session = FakeClientSession(delays={"slow_1": 0.02, "wrong": 0, "slow_2": 0.01})
+
+    is_valid, cancelled = _run(session, fail_fast=False)
+
+    assert not is_valid
+    assert sorted(session.called) == ["slow_1", "slow_2", "wrong"]
+    assert cancelled == []
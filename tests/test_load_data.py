@@ -0,0 +1,27 @@
+from src.evals.load_data import EvalDataPoint, load_eval_data
+
+
+def test_trailing_blank_line_is_skipped(tmp_path):
+    csv_file = tmp_path / "eval_data.csv"
+    csv_file.write_text(
+        'prompt,expected_tools,final_msg_facts\n'
+        '"Create a task","jira_create_issue,jira_search","Task created"\n'
+        '\n',
+        encoding="utf-8",
+    )
+
+    # An absolute path is used as is by the join onto the module's directory
+    assert load_eval_data(str(csv_file)) == [
+        EvalDataPoint(
+            prompt="Create a task",
+            expected_tools=["jira_create_issue", "jira_search"],
+            final_msg_facts="Task created",
+        ),
+    ]
+
+
+def test_header_only_file_has_no_data(tmp_path):
+    csv_file = tmp_path / "eval_data.csv"
+    csv_file.write_text("prompt,expected_tools,final_msg_facts\n", encoding="utf-8")
+
+    assert load_eval_data(str(csv_file)) == []
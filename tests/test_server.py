@@ -0,0 +1,78 @@
+import asyncio
+from contextlib import AsyncExitStack
+
+from google.adk.tools.mcp_tool.mcp_session_manager import MCPSessionManager
+import pytest
+
+from src.jira_mcp_server.server import JiraMCPServer
+from tests.fake_mcp import FakeClientSession, FakeSessionFactory
+
+
+def _server(session: FakeClientSession) -> JiraMCPServer:
+    return JiraMCPServer(mcp_session_manager=None, client_session=session, tools=[])
+
+
+def test_batch_call_tool_keeps_call_order():
+    session = FakeClientSession(delays={"slow": 0.05, "medium": 0.02, "fast": 0})
+
+    responses = asyncio.run(_server(session).batch_call_tool_dict_resp(
+        calls=[("slow", {}), ("medium", {}), ("fast", {})],
+    ))
+
+    assert responses == [{"name": "slow"}, {"name": "medium"}, {"name": "fast"}]
+
+
+def test_batch_call_tool_failure_cancels_remaining_calls():
+    session = FakeClientSession(delays={"bad": 0.01, "slow_1": 1, "slow_2": 1}, failing=("bad",))
+
+    async def _batch_call() -> list:
+        with pytest.raises(RuntimeError, match="bad failed"):
+            await _server(session).batch_call_tool(
+                calls=[("bad", {}), ("slow_1", {}), ("slow_2", {})],
+            )
+        # Checked before the event loop closes, which would cancel any leftover calls itself
+        return sorted(session.cancelled)
+
+    assert asyncio.run(_batch_call()) == ["slow_1", "slow_2"]
+
+
+def test_reconnect_is_shared_by_concurrent_callers_and_tools(monkeypatch):
+    factory = FakeSessionFactory()
+    monkeypatch.setattr(MCPSessionManager, "initialize_session", factory)
+
+    async def _run() -> None:
+        stack = AsyncExitStack()
+        server = await JiraMCPServer.initialize(
+            jira_url="https://reconnect.example",
+            jira_username="user",
+            jira_api_token="token",
+            enabled_tools="",
+            exit_stack=stack,
+        )
+        [tool] = server.get_tools()
+        [first_session] = factory.sessions
+        first_session.closed = True
+
+        # Validation calls racing on the closed session, from tasks other than the stack owner
+        responses = await asyncio.gather(*(
+            server.call_tool_dict_resp(name="echo", arguments={}) for _ in range(3)
+        ))
+        assert responses == [{"name": "echo"}] * 3
+        assert len(factory.sessions) == 2
+        new_session = factory.sessions[1]
+        assert tool.mcp_session is new_session
+
+        # An agent tool that finds the session closed first reconnects through the server
+        new_session.closed = True
+        await asyncio.create_task(tool.run_async(args={}, tool_context=None))
+        assert len(factory.sessions) == 3
+        assert tool.mcp_session is factory.sessions[2]
+        await server.call_tool(name="echo", arguments={})
+        assert factory.sessions[2].called == ["echo", "echo"]
+
+        await stack.aclose()
+        assert all(task.done() for task in server._reconnect_tasks)
+        # Each transport is closed by the task that opened it
+        assert sorted(map(id, factory.closed_in)) == sorted(map(id, factory.opened_in))
+
+    asyncio.run(_run())
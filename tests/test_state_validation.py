@@ -0,0 +1,42 @@
+from src.data.dataset_entities.state_validation import ApiCallValidation
+
+
+def _validation(expected_fields=None, expected_field_presence=None) -> ApiCallValidation:
+    return ApiCallValidation(
+        tool_name="jira_get_issue",
+        arguments={"issue_key": "MBA-1"},
+        expected_fields=expected_fields,
+        expected_field_presence=expected_field_presence,
+    )
+
+
+RESPONSE = {
+    "key": "MBA-1",
+    "fields": {"summary": "Test issue", "assignee": None},
+    "comments": [{"body": "First"}],
+}
+
+
+def test_nested_field_and_index_access():
+    validation = _validation(
+        expected_fields={"fields.summary": "Test issue", "comments.0.body": "First"},
+        expected_field_presence=["key", "comments.0"],
+    )
+
+    assert validation.validate_response(RESPONSE)
+
+
+def test_index_into_string_field_does_not_match():
+    assert not _validation(expected_fields={"key.0": "M"}).validate_response(RESPONSE)
+
+
+def test_index_into_string_field_is_not_present():
+    assert not _validation(expected_field_presence=["key.3"]).validate_response(RESPONSE)
+
+
+def test_out_of_range_index_is_not_present():
+    assert not _validation(expected_field_presence=["comments.1"]).validate_response(RESPONSE)
+
+
+def test_none_field_is_not_present():
+    assert not _validation(expected_field_presence=["fields.assignee"]).validate_response(RESPONSE)
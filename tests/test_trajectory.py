@@ -0,0 +1,53 @@
+import json
+
+from google.adk.events.event import Event
+from google.genai import types
+from mcp.types import CallToolResult, EmbeddedResource, TextResourceContents
+
+from src.evals.trajectory import dump_trajectory, parse_events_to_trajectory
+
+
+def _embedded_resource_result() -> CallToolResult:
+    return CallToolResult.model_validate({
+        "_meta": {"source": "jira"},
+        "content": [
+            EmbeddedResource(
+                type="resource",
+                resource=TextResourceContents(uri="https://example.atlassian.net/browse/MBA-1", text="MBA-1"),
+            ),
+        ],
+        "isError": False,
+        "requestId": "extra-field",
+    })
+
+
+def _tool_response_event(result: CallToolResult) -> Event:
+    return Event(
+        author="JiraMCPAgent",
+        content=types.Content(role="user", parts=[
+            types.Part(function_response=types.FunctionResponse(
+                id="call_0", name="jira_get_issue", response={"result": result},
+            )),
+        ]),
+    )
+
+
+def test_dump_trajectory_with_non_text_mcp_result():
+    trajectory = parse_events_to_trajectory([_tool_response_event(_embedded_resource_result())])
+
+    dumped = json.loads(dump_trajectory(trajectory))
+
+    result = dumped["messages"][0]["tool_results"][0]["result_data"]["result"]
+    assert result["content"][0]["resource"]["uri"] == "https://example.atlassian.net/browse/MBA-1"
+    assert result["_meta"] == {"source": "jira"}
+    assert result["requestId"] == "extra-field"
+
+
+def test_dump_pydantic_trajectory_with_non_text_mcp_result():
+    trajectory = parse_events_to_trajectory([_tool_response_event(_embedded_resource_result())])
+
+    dumped = json.loads(dump_trajectory(trajectory.to_pydantic()))
+
+    result = dumped["messages"][0]["tool_results"][0]["result_data"]["result"]
+    assert result["content"][0]["resource"]["uri"] == "https://example.atlassian.net/browse/MBA-1"
+    assert "assistant_text_response" in dumped["messages"][0]